@@ -0,0 +1,28 @@
+"""
+NanoMan - Optional Cython Build
+Compiles src/logic.py to a C extension for lower per-call overhead.
+Part of the Nano Product Family.
+
+NanoMan runs fine without this step - src/logic.py stays plain Python
+and is used whenever no compiled module is present.
+
+Usage:
+    pip install cython setuptools
+    python setup.py build_ext --inplace
+
+Remove the generated src/logic.*.so / .pyd to go back to pure Python.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="nanoman-logic",
+    ext_modules=cythonize(
+        ["src/logic.py"],
+        language_level=3,
+        # Keep Python semantics: helpers accept None/non-str input by design
+        compiler_directives={"annotation_typing": False},
+    ),
+    zip_safe=False,
+)
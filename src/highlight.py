@@ -0,0 +1,245 @@
+"""
+NanoMan - Highlight Module
+JSON tokenizer for response syntax highlighting.
+Part of the Nano Product Family.
+
+Pure Python (no tkinter), so it can be tested and run off the UI thread.
+Ranges are returned as Tk text indices ("line.column"), grouped by tag so
+the UI can apply each tag with a single tag_add call.
+
+Bodies in the exact layout format_json() produces are tokenized by walking
+the parsed document; anything else falls back to a regex scan.
+"""
+
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from json.encoder import encode_basestring
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.logic import json_loads
+
+# Tag names, in the order the UI configures them
+JSON_TAGS = ("key", "string", "number", "boolean", "null")
+
+# One alternation, one pass over the text. Strings are consumed whole
+# (escape-aware), so true/false/null/digits inside strings are not tagged.
+# A string followed by a colon is an object key. An unterminated string
+# runs to the end of its line instead of failing: re-trying from every
+# later quote would make the scan quadratic on malformed bodies.
+_JSON_TOKEN_RE = re.compile(
+    r'(?P<string>"[^"\\\n]*(?:\\.[^"\\\n]*)*"?)(?P<colon>\s*:)?'
+    r'|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)'
+    r'|(?P<boolean>(?:true|false)\b)'
+    r'|(?P<null>null\b)'
+)
+_NEWLINE_RE = re.compile(r'\n')
+
+# JSON documents worth highlighting open with an object or array
+_CONTAINER_START_RE = re.compile(r'\s*[\[{]')
+
+# format_json() layout: json.dumps(indent=4) - only such bodies are walked
+_INDENT = 4
+_PRETTY_PREFIXES = ("{\n" + " " * _INDENT, "[\n" + " " * _INDENT)
+
+# Re-sending a request or reopening a response yields the same body, so
+# recent token ranges are memoized. Huge bodies are not kept alive.
+TOKEN_CACHE_SIZE = 32
+MAX_CACHED_LENGTH = 2_000_000
+
+
+def tokenize_json(content: str) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Find JSON token ranges for syntax highlighting.
+    
+    Results for recently seen content are cached; the returned mapping
+    is read-only and may be shared between calls.
+
+    Args:
+        content: JSON text (typically pretty-printed)
+
+    Returns:
+        Read-only mapping of tag -> flat tuple of Tk indices
+        (start1, end1, start2, end2, ...)
+    """
+    if len(content) > MAX_CACHED_LENGTH:
+        return _tokenize(content)
+    return _tokenize_cached(content)
+
+
+def looks_like_json(content: str) -> bool:
+    """
+    Cheap pre-check before tokenizing: does content start with '{' or '['?
+    
+    Rejects HTML error pages and plain text served as JSON without
+    scanning (or copying) the body.
+    """
+    return _CONTAINER_START_RE.match(content) is not None
+
+
+def tokenize_json_blocks(content: str, block_lines: int) -> Tuple[Mapping[str, Tuple[str, ...]], ...]:
+    """
+    Token ranges grouped into blocks of lines, for viewport-only highlighting.
+    
+    Cached like tokenize_json, so a repeated body costs neither
+    tokenizing nor splitting; the result is read-only.
+    
+    Args:
+        content: JSON text (typically pretty-printed)
+        block_lines: Lines per block
+        
+    Returns:
+        Tuple where item n holds the tokenize_json() ranges starting on
+        lines n * block_lines + 1 .. (n + 1) * block_lines
+    """
+    if len(content) > MAX_CACHED_LENGTH:
+        return _tokenize_blocks(content, block_lines)
+    return _tokenize_blocks_cached(content, block_lines)
+
+
+def _tokenize(content: str) -> Mapping[str, Tuple[str, ...]]:
+    """Tokenize content without caching (see tokenize_json)."""
+    return MappingProxyType({
+        tag: _format_spans(spans) for tag, spans in _find_spans(content).items()
+    })
+
+
+def _tokenize_blocks(content: str, block_lines: int) -> Tuple[Mapping[str, Tuple[str, ...]], ...]:
+    """Tokenize and split content without caching (see tokenize_json_blocks)."""
+    spans = _find_spans(content)
+    blocks = []
+    for tag, found in spans.items():
+        for i in range(0, len(found), 3):
+            line = found[i]
+            block = (line - 1) // block_lines
+            while len(blocks) <= block:
+                blocks.append({name: [] for name in spans})
+            indices = blocks[block][tag]
+            indices.append(f"{line}.{found[i + 1]}")
+            indices.append(f"{line}.{found[i + 2]}")
+    return tuple(
+        MappingProxyType({tag: tuple(indices) for tag, indices in block.items()})
+        for block in blocks
+    )
+
+
+def _format_spans(spans: Sequence[int]) -> Tuple[str, ...]:
+    """Turn flat (line, start, end) triples into flat Tk start/end indices."""
+    indices = []
+    for i in range(0, len(spans), 3):
+        line = spans[i]
+        indices.append(f"{line}.{spans[i + 1]}")
+        indices.append(f"{line}.{spans[i + 2]}")
+    return tuple(indices)
+
+
+def _find_spans(content: str) -> Dict[str, List[int]]:
+    """
+    Locate tokens as flat (line, start column, end column) int triples.
+    
+    Indices stay ints until the final Tk strings are built, so grouping
+    into blocks needs no string parsing.
+    """
+    spans = None
+    if content.startswith(_PRETTY_PREFIXES):
+        spans = _walk_json(content)
+    if spans is None:
+        spans = _scan_json(content)
+    return spans
+
+
+def _walk_json(content: str) -> Optional[Dict[str, List[int]]]:
+    """
+    Compute token ranges from the parsed document instead of scanning text.
+    
+    Positions are derived from the json.dumps(indent=4) layout, then checked
+    against the real line count and length of content.
+    
+    Returns:
+        Spans per tag (see _find_spans), or None if content is not in that layout
+    """
+    try:
+        document = json_loads(content)
+    except ValueError:
+        return None
+    
+    ranges = {tag: [] for tag in JSON_TAGS}
+    keys = ranges["key"]
+    line = 1
+    length = 0  # Characters emitted so far, to verify the layout at the end
+    
+    def add_scalar(value, column: int) -> int:
+        if value is None:
+            tag, text = "null", "null"
+        elif value is True:
+            tag, text = "boolean", "true"
+        elif value is False:
+            tag, text = "boolean", "false"
+        elif isinstance(value, str):
+            tag, text = "string", encode_basestring(value)
+        else:
+            tag, text = "number", repr(value)
+        ranges[tag].extend((line, column, column + len(text)))
+        return len(text)
+    
+    def walk(container, indent: int):
+        # Opening bracket is already on the current line
+        nonlocal line, length
+        if not container:
+            length += 1  # Closing bracket of "{}" / "[]"
+            return
+        column = indent + _INDENT
+        is_dict = isinstance(container, dict)
+        items = container.items() if is_dict else enumerate(container)
+        for key, value in items:
+            line += 1
+            length += 1 + column + 1  # Newline, indent, trailing comma
+            start = column
+            if is_dict:
+                width = len(encode_basestring(key))
+                keys.extend((line, column, column + width))
+                start += width + 2  # After '"key": '
+                length += width + 2
+            if isinstance(value, (dict, list)):
+                length += 1  # Opening bracket
+                walk(value, column)
+            else:
+                length += add_scalar(value, start)
+        line += 1
+        length += indent + 1  # Closing bracket line; its newline balances the last comma
+    
+    try:
+        walk(document, 0)
+    except RecursionError:
+        return None
+    length += 1  # Top-level opening bracket
+    
+    if line != content.count("\n") + 1 or length != len(content):
+        return None
+    return ranges
+
+
+def _scan_json(content: str) -> Dict[str, List[int]]:
+    """Tokenize content with the regex scanner (any layout)."""
+    ranges = {tag: [] for tag in JSON_TAGS}
+    if content:
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(content))
+
+        for match in _JSON_TOKEN_RE.finditer(content):
+            tag = match.lastgroup
+            if tag == "colon":
+                tag = "key"
+            start, end = match.span("string" if tag == "key" else tag)
+
+            line = bisect_right(line_starts, start) - 1
+            line_start = line_starts[line]
+            # Tokens never span lines (JSON strings cannot contain raw newlines)
+            ranges[tag].extend((line + 1, start - line_start, end - line_start))
+
+    return ranges
+
+
+_tokenize_cached = lru_cache(maxsize=TOKEN_CACHE_SIZE)(_tokenize)
+_tokenize_blocks_cached = lru_cache(maxsize=TOKEN_CACHE_SIZE)(_tokenize_blocks)
@@ -11,13 +11,73 @@ Security Focus:
 """
 
 import requests
+import urllib3
 import json
+import os
 import re
+import socket
+import sys
+import time
 import logging
-from typing import Optional, Dict, Any
+from http.cookiejar import DefaultCookiePolicy
+from urllib.request import getproxies
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry
+from typing import Optional, Dict, Any, Callable, Iterable, List, Mapping, NamedTuple, Union
+
+# Optional: orjson is several times faster than stdlib json on large payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Relaxed regex: allows http:// or https:// with various host formats
+# - Domain with TLD (example.com)
+# - Hostname without TLD (intranet, server1)
+# - localhost
+# - IPv4 addresses
+# The host is matched as a single bounded token (no nested repetition), so
+# matching stays linear in URL length; label rules are checked in Python.
+# Matched against the lowercased URL, so no IGNORECASE and only ASCII
+# ranges in the scheme/host/port (the path keeps Unicode-aware \s).
+# Compiled once at import; validate_url() runs on every request.
+_URL_RE = re.compile(
+    r'\Ahttps?://'  # http:// or https:// ONLY
+    r'(?P<host>[a-z0-9][a-z0-9.\-]{0,253})'  # Hostname or IPv4 (see _valid_host)
+    r'(?::[0-9]{1,5})?'  # Optional port
+    r'(?:/[^\s]*)?\Z'  # Optional path
+)
+
+MAX_LABEL_LENGTH = 63  # RFC 1035 label limit
+MAX_URL_LENGTH = 2048  # Longer URLs are rejected before regex matching
+_URL_SCHEMES = ('http://', 'https://')
+
+
+def _valid_host(host: str) -> bool:
+    """
+    Check hostname labels matched by _URL_RE.
+    
+    All-numeric hosts are IPv4 addresses and must parse as one
+    (rejects octets above 255). Otherwise each dot-separated label must
+    be 1-63 characters and must not start or end with a hyphen.
+    """
+    if host.replace('.', '').isdigit():
+        try:
+            socket.inet_aton(host)
+        except OSError:
+            return False
+        return True
+    
+    for label in host.split('.'):
+        if not label or len(label) > MAX_LABEL_LENGTH:
+            return False
+        if label[0] == '-' or label[-1] == '-':
+            return False
+    return True
+
 
 def validate_url(url: str) -> bool:
     """
@@ -27,6 +87,7 @@ def validate_url(url: str) -> bool:
     Security: Prevents XSS via javascript:, ftp:, file:, data: URLs
     
     Note: Allows intranet hostnames without TLD (e.g., http://intranet/api)
+    Note: URLs longer than MAX_URL_LENGTH characters are rejected
     
     Args:
         url: The URL to validate
@@ -37,25 +98,102 @@ def validate_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    url = url.strip()
-    
-    # Relaxed regex: allows http:// or https:// with various host formats
-    # - Domain with TLD (example.com)
-    # - Hostname without TLD (intranet, server1)
-    # - localhost
-    # - IPv4 addresses
-    pattern = re.compile(
-        r'^https?://'  # http:// or https:// ONLY
-        r'(?:'
-            r'(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)*[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?'  # Any hostname
-            r'|\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'  # or IPv4
-        r')'
-        r'(?::\d{1,5})?'  # Optional port
-        r'(?:/[^\s]*)?$',  # Optional path
-        re.IGNORECASE
-    )
+    # Scheme and host are case-insensitive: lowercase once for checking only
+    url_for_check = url.strip().lower()
+    
+    # Fast path: reject wrong scheme or oversized input without the regex
+    if len(url_for_check) > MAX_URL_LENGTH or not url_for_check.startswith(_URL_SCHEMES):
+        return False
+    
+    match = _URL_RE.match(url_for_check)
+    return bool(match) and _valid_host(match.group('host'))
+
+
+def validate_urls(urls: Iterable[str]) -> List[bool]:
+    """
+    Validate many URLs at once (e.g. a request collection).
+    
+    Args:
+        urls: URLs to validate
+        
+    Returns:
+        One validate_url() result per URL, in input order
+    """
+    return list(map(validate_url, urls))
+
+
+MAX_PRETTY_BYTES = 1 << 20  # Larger JSON responses are shown as received
+
+# orjson silently turns integers outside the int64/uint64 range into
+# floats; any run of 20+ digits (or a 19-digit negative, which may be below
+# -2**63) routes parsing through stdlib json, which keeps them exact.
+_LONG_DIGITS_RE = re.compile(r'-\d{19}|\d{20}')
+_LONG_DIGITS_BYTES_RE = re.compile(rb'-[0-9]{19}|[0-9]{20}')
+_LEADING_SPACES_RE = re.compile(r'^( +)', re.MULTILINE)
+# Floats below 1e-4 or from 1e16 up are spelled differently by orjson
+# (1e100 / 0.00001 vs 1e+100 / 1e-05). Matches such a number where a
+# value starts in the indented layout: after '": ', at line start, or as
+# the whole (scalar) document.
+_ORJSON_FLOAT_SPELLING_RE = re.compile(r'(?:^ +|": |\A)-?(?:\d+(?:\.\d+)?e|0\.0000)', re.MULTILINE)
+
+
+def json_loads(text: str) -> Any:
+    """
+    Parse JSON text, using orjson when available.
+    
+    Falls back to stdlib json on orjson errors so that error messages and
+    non-standard input (NaN, huge integers) behave exactly as before.
     
-    return bool(pattern.match(url))
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def json_dumps_line(obj: Any) -> bytes:
+    """
+    Serialize obj as one compact UTF-8 JSON line (for JSONL files).
+    
+    Uses orjson when available; output is valid JSON either way.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj) + b"\n"
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _orjson_pretty(text: Union[str, bytes]) -> Optional[str]:
+    """
+    Pretty-print JSON text with orjson, matching json.dumps(indent=4).
+    
+    Args:
+        text: JSON as str or UTF-8 bytes (parsed without decoding first)
+    
+    Returns:
+        Formatted JSON string, or None if orjson is unavailable or cannot
+        handle the input (caller falls back to stdlib json)
+    """
+    if orjson is None:
+        return None
+    long_digits = _LONG_DIGITS_BYTES_RE if isinstance(text, bytes) else _LONG_DIGITS_RE
+    if long_digits.search(text):
+        return None
+    try:
+        pretty = orjson.dumps(orjson.loads(text), option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONDecodeError:
+        return None
+    if _ORJSON_FLOAT_SPELLING_RE.search(pretty):
+        return None  # Stdlib json spells these floats like json.dumps does
+    # JSON strings never contain raw newlines, so leading spaces are always
+    # indentation: doubling them gives the same layout as indent=4
+    return _LEADING_SPACES_RE.sub(r'\1\1', pretty)
 
 
 def format_json(text: str) -> str:
@@ -71,6 +209,11 @@ def format_json(text: str) -> str:
     if not text:
         return text
     
+    if isinstance(text, str):
+        pretty = _orjson_pretty(text)
+        if pretty is not None:
+            return pretty
+    
     try:
         parsed = json.loads(text)
         return json.dumps(parsed, indent=4, ensure_ascii=False)
@@ -92,21 +235,176 @@ def parse_headers(headers_text: str) -> Dict[str, str]:
     if not headers_text or not headers_text.strip():
         return headers
     
-    for line in headers_text.strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            headers[key.strip()] = value.strip()
+    # splitlines() also handles \r\n pasted from Windows/browser tools
+    for line in headers_text.splitlines():
+        key, sep, value = line.partition(':')
+        if sep:
+            # Keys repeat across requests (Content-Type, Authorization...):
+            # interning shares one str object and its cached hash
+            headers[sys.intern(key.strip())] = value.strip()
     
     return headers
 
 
+class ApiResult(NamedTuple):
+    """
+    Result of send_api_request().
+    
+    A named tuple: fixed field layout, no per-instance dict. On failure
+    only success=False and error are set.
+    """
+    success: bool
+    status_code: Optional[int] = None
+    reason: Optional[str] = None
+    elapsed_seconds: Optional[float] = None
+    headers: Optional[Mapping[str, str]] = None
+    body: Optional[str] = None
+    is_json: bool = False
+    error: Optional[str] = None
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the shared HTTP session used for all requests.
+    
+    Reusing one session keeps TCP/TLS connections alive between requests
+    to the same host. Cookies are never stored, so each request still
+    behaves like a standalone requests.request() call.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+def _environment_needs_session() -> bool:
+    """
+    Check if requests would apply settings from the environment.
+    
+    Proxies, a custom CA bundle or a netrc file are only honoured by the
+    requests session, so the urllib3 fast path must not be used then.
+    """
+    if getproxies():
+        return True
+    if os.environ.get('REQUESTS_CA_BUNDLE') or os.environ.get('CURL_CA_BUNDLE'):
+        return True
+    if os.environ.get('NETRC'):
+        return True
+    home = os.path.expanduser('~')
+    return any(os.path.exists(os.path.join(home, name)) for name in requests.utils.NETRC_FILES)
+
+
+# Fast path for plain GETs: urllib3 directly, skipping requests' per-call
+# setup (PreparedRequest, hooks, cookie jar, environment merging).
+# Same CA bundle, default headers and redirect limit as the session.
+_USE_FAST_GET = not _environment_needs_session()
+_POOL = urllib3.PoolManager(
+    num_pools=8,
+    maxsize=16,
+    cert_reqs='CERT_REQUIRED',
+    ca_certs=requests.certs.where(),
+)
+_FAST_RETRIES = Retry(total=None, connect=0, read=0, redirect=30, status=0, other=0)
+
+
+def _fast_get(url: str, headers: Optional[Dict[str, str]], timeout: int) -> urllib3.HTTPResponse:
+    """
+    Send a GET without a body through the shared urllib3 pool.
+    
+    Raises:
+        urllib3.exceptions.HTTPError: On connection, timeout or protocol errors
+    """
+    merged = CaseInsensitiveDict(_SESSION.headers)
+    if headers:
+        merged.update(headers)
+    return _POOL.request('GET', url, headers=dict(merged), timeout=timeout, retries=_FAST_RETRIES)
+
+
+def _decode_body(content: bytes, encoding: Optional[str]) -> str:
+    """
+    Decode a fast-path body like requests' Response.text (lenient).
+    
+    Args:
+        encoding: Charset from the headers; if None it is guessed from
+            the content, as Response.apparent_encoding does
+    """
+    if not content:
+        return ""
+    if encoding is None:
+        encoding = requests.compat.chardet.detect(content)["encoding"]
+    try:
+        return str(content, encoding or "utf-8", errors="replace")
+    except LookupError:  # Unknown charset in Content-Type
+        return str(content, "utf-8", errors="replace")
+
+
+def _fast_get_error(error: urllib3.exceptions.HTTPError, timeout: int) -> ApiResult:
+    """Map a urllib3 error to the same messages as the requests path."""
+    reason = error.reason if isinstance(error, urllib3.exceptions.MaxRetryError) else error
+    # NewConnectionError subclasses ConnectTimeoutError, so check it first
+    if isinstance(reason, (urllib3.exceptions.NewConnectionError,
+                           urllib3.exceptions.ProtocolError,
+                           urllib3.exceptions.SSLError)):
+        message = f"Connection failed: {str(error)}"
+    elif isinstance(reason, urllib3.exceptions.TimeoutError):
+        message = f"Request timed out after {timeout} seconds"
+    else:
+        message = f"Request failed: {str(error)}"
+    return ApiResult(success=False, error=message)
+
+
+def _response_result(
+    status_code: int,
+    reason: str,
+    headers: Any,
+    content: bytes,
+    get_text: Callable[[], str],
+    elapsed: float
+) -> ApiResult:
+    """
+    Build the success result shared by the session and fast GET paths.
+    
+    Args:
+        get_text: Returns the decoded body; only called when needed
+    """
+    # Determine if response is JSON
+    content_type = headers.get("Content-Type", "")
+    is_json = "application/json" in content_type
+    
+    # Format response body (huge JSON is left as-is: a full parse and
+    # re-serialize would hold several copies of it in memory)
+    if is_json and len(content) < MAX_PRETTY_BYTES:
+        # orjson parses the raw UTF-8 bytes, skipping the str decode;
+        # other encodings or invalid JSON go through the text path
+        body = _orjson_pretty(content)
+        if body is None:
+            body = format_json(get_text())
+    else:
+        body = get_text()
+    
+    return ApiResult(
+        success=True,
+        status_code=status_code,
+        reason=sys.intern(reason) if reason else reason,  # "OK", "Not Found"... repeat per response
+        elapsed_seconds=elapsed,
+        headers=headers,
+        body=body,
+        is_json=is_json
+    )
+
+
 def send_api_request(
     method: str, 
     url: str, 
     payload: Optional[str] = None,
     headers: Optional[Dict[str, str]] = None,
     timeout: int = 10
-) -> Dict[str, Any]:
+) -> ApiResult:
     """
     Send an API request and return the result.
     
@@ -118,68 +416,83 @@ def send_api_request(
         timeout: Request timeout in seconds
         
     Returns:
-        Dictionary with response data or error information
+        ApiResult with response data or error information.
+        headers is the response's case-insensitive header mapping
+        (read-only use; not copied into a plain dict).
+        elapsed_seconds is the full round trip, including the body download
     """
     # Security: Validate URL first
     if not validate_url(url):
-        logger.warning(f"Invalid URL rejected: {url[:50]}...")
-        return {
-            "success": False,
-            "error": "Invalid or unsafe URL. Only http:// and https:// are allowed."
-        }
+        logger.warning("Invalid URL rejected: %.50s...", url)
+        return ApiResult(
+            success=False,
+            error="Invalid or unsafe URL. Only http:// and https:// are allowed."
+        )
     
     # Parse JSON payload if provided
     json_data = None
     if payload and payload.strip():
         try:
-            json_data = json.loads(payload)
+            json_data = json_loads(payload)
         except json.JSONDecodeError as e:
-            return {
-                "success": False,
-                "error": f"Invalid JSON in request body: {str(e)}"
-            }
+            return ApiResult(
+                success=False,
+                error=f"Invalid JSON in request body: {str(e)}"
+            )
+    
+    # Fast path: plain GET without body (the UI drops its untouched
+    # placeholder body on GET, so this covers most presets and examples)
+    if _USE_FAST_GET and json_data is None and method.upper() == "GET":
+        try:
+            started = time.perf_counter()
+            response = _fast_get(url, headers, timeout)
+            elapsed = time.perf_counter() - started
+        except urllib3.exceptions.HTTPError as e:
+            return _fast_get_error(e, timeout)
+        
+        encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return _response_result(
+            response.status,
+            response.reason,
+            response.headers,
+            response.data,
+            lambda: _decode_body(response.data, encoding),
+            elapsed
+        )
     
     # Send request
     try:
-        response = requests.request(
+        started = time.perf_counter()
+        response = _SESSION.request(
             method=method.upper(),
             url=url,
             json=json_data,
             headers=headers or {},
             timeout=timeout
         )
+        elapsed = time.perf_counter() - started
         
-        # Determine if response is JSON
-        content_type = response.headers.get("Content-Type", "")
-        is_json = "application/json" in content_type
-        
-        # Format response body
-        body = response.text
-        if is_json:
-            body = format_json(body)
-        
-        return {
-            "success": True,
-            "status_code": response.status_code,
-            "reason": response.reason,
-            "elapsed_seconds": response.elapsed.total_seconds(),
-            "headers": dict(response.headers),
-            "body": body,
-            "is_json": is_json
-        }
+        return _response_result(
+            response.status_code,
+            response.reason,
+            response.headers,
+            response.content,
+            lambda: response.text,
+            elapsed
+        )
         
     except requests.exceptions.Timeout:
-        return {
-            "success": False,
-            "error": f"Request timed out after {timeout} seconds"
-        }
+        return ApiResult(
+            success=False,
+            error=f"Request timed out after {timeout} seconds"
+        )
     except requests.exceptions.ConnectionError as e:
-        return {
-            "success": False,
-            "error": f"Connection failed: {str(e)}"
-        }
+        return ApiResult(
+            success=False,
+            error=f"Connection failed: {str(e)}"
+        )
     except requests.exceptions.RequestException as e:
-        return {
-            "success": False,
-            "error": f"Request failed: {str(e)}"
-        }
+        return ApiResult(
+            success=False,
+            error=f"Request failed: {str(e)}"
+        )
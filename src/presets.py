@@ -6,6 +6,8 @@ No cloud integration - just convenience presets.
 Part of the Nano Product Family.
 """
 
+from types import MappingProxyType
+
 # === Auth Presets ===
 AUTH_PRESETS = {
     "none": {
@@ -121,27 +123,33 @@ API_TEMPLATES = {
 }
 
 
+# === Freeze presets (read-only views; "headers" stay plain dicts for merging) ===
+AUTH_PRESETS = MappingProxyType({k: MappingProxyType(v) for k, v in AUTH_PRESETS.items()})
+API_TEMPLATES = MappingProxyType({k: MappingProxyType(v) for k, v in API_TEMPLATES.items()})
+
+
+# === Lookup by display name (built once, presets are constant) ===
+_AUTH_BY_NAME = {preset["name"]: preset for preset in AUTH_PRESETS.values()}
+_TEMPLATE_BY_NAME = {template["name"]: template for template in API_TEMPLATES.values()}
+_AUTH_NAMES = tuple(_AUTH_BY_NAME)
+_TEMPLATE_NAMES = tuple(_TEMPLATE_BY_NAME)
+
+
 def get_auth_preset_names() -> list:
     """Return list of auth preset names for UI dropdown."""
-    return [preset["name"] for preset in AUTH_PRESETS.values()]
+    return list(_AUTH_NAMES)
 
 
 def get_api_template_names() -> list:
     """Return list of API template names for UI."""
-    return [template["name"] for template in API_TEMPLATES.values()]
+    return list(_TEMPLATE_NAMES)
 
 
 def get_auth_preset_by_name(name: str) -> dict:
     """Get auth preset by display name."""
-    for key, preset in AUTH_PRESETS.items():
-        if preset["name"] == name:
-            return preset
-    return AUTH_PRESETS["none"]
+    return _AUTH_BY_NAME.get(name, AUTH_PRESETS["none"])
 
 
 def get_api_template_by_name(name: str) -> dict:
     """Get API template by display name."""
-    for key, template in API_TEMPLATES.items():
-        if template["name"] == name:
-            return template
-    return API_TEMPLATES["localhost"]
+    return _TEMPLATE_BY_NAME.get(name, API_TEMPLATES["localhost"])
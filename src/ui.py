@@ -5,19 +5,22 @@ Part of the Nano Product Family.
 """
 
 import customtkinter as ctk
+import sys
 import threading
+import queue
+from collections import OrderedDict, deque
 import logging
 import json
-import re
 import os
 from datetime import datetime
 from pathlib import Path
 
-from src.logic import validate_url, send_api_request, format_json, parse_headers
+from src.logic import validate_url, send_api_request, format_json, parse_headers, ApiResult
+from src.logic import json_loads, json_dumps_line
+from src.highlight import tokenize_json_blocks, looks_like_json
 from src.presets import (
     AUTH_PRESETS, API_TEMPLATES, 
-    get_auth_preset_names, get_api_template_names,
-    get_auth_preset_by_name, get_api_template_by_name,
+    get_auth_preset_names, get_auth_preset_by_name,
 )
 from version import VERSION
 
@@ -37,7 +40,18 @@ logger = logging.getLogger(__name__)
 
 # Constants
 MAX_HIGHLIGHT_LINES = 1000  # Performance limit for syntax highlighting
+MAX_HIGHLIGHT_CHARS = 200_000  # Checked first - cheaper than counting lines
+HIGHLIGHT_BLOCK_LINES = 100  # Tags are applied per block as it scrolls into view
+STREAM_THRESHOLD_CHARS = 1 << 20  # Larger bodies are inserted in chunks
+MAX_DISPLAY_CHARS = 512 * 1024  # Longer responses are truncated until "Load full"
+RESPONSE_CACHE_SIZE = 20  # Last responses kept in memory for "Load" from history
+DEFAULT_BODY = '{\n    "key": "value"\n}'  # Used until the Request Body tab is opened
+DEFAULT_HEADERS = "Content-Type: application/json"  # Used until the Headers tab is opened
+STREAM_CHUNK_CHARS = 1 << 16  # Characters per after_idle insert
 MAX_HISTORY_ITEMS = 100  # Max items to persist
+HISTORY_VISIBLE_ROWS = 20  # History row widgets in the pool, reused while scrolling
+HISTORY_ROW_HEIGHT = 42  # Unscaled px per row: 28px widgets, 2x5px inner and 2x2px outer pady
+HISTORY_FLUSH_TIMEOUT = 1.0  # Seconds on_close waits for queued history lines
 
 
 def get_config_dir() -> Path:
@@ -50,7 +64,8 @@ def get_config_dir() -> Path:
     return config_dir
 
 
-HISTORY_FILE = get_config_dir() / "history.json"
+HISTORY_FILE = get_config_dir() / "history.jsonl"  # One JSON object per line, append-only
+LEGACY_HISTORY_FILE = get_config_dir() / "history.json"  # Pre-JSONL format, migrated on load
 
 # Nano Design System Colors (from nano_theme.py)
 COLORS = {
@@ -65,6 +80,64 @@ COLORS = {
 }
 
 
+# Method badge colors for template examples
+_METHOD_COLORS = {
+    "GET": COLORS["primary"],
+    "POST": COLORS["success"],
+    "PUT": COLORS["warning"],
+    "PATCH": COLORS["warning"],
+    "DELETE": COLORS["danger"],
+}
+
+# Status color by status class (code // 100); anything else is an error
+_STATUS_COLORS = {
+    2: "#27ae60",  # Green
+    3: "#f39c12",  # Orange
+}
+_STATUS_ERROR_COLOR = "#e74c3c"  # Red
+
+
+def _status_color(status_code: int) -> str:
+    """Color for an HTTP status code (status label and history rows)."""
+    return _STATUS_COLORS.get(status_code // 100, _STATUS_ERROR_COLOR)
+
+
+def request_payload(method: str, body_text: str) -> str:
+    """
+    Body to send for a request; the untouched placeholder is dropped on GET.
+    
+    Any other body is sent as typed, for every method.
+    """
+    if method == "GET" and body_text == DEFAULT_BODY:
+        return ""
+    return body_text
+
+
+def json_highlight_ranges(content: str):
+    """
+    Compute JSON token ranges, honouring MAX_HIGHLIGHT_CHARS/LINES.
+    
+    Bodies that do not start with an object or array are not highlighted.
+    
+    Touches no widgets, so it is safe to call from the request thread.
+    
+    Returns:
+        Token ranges from tokenize_json_blocks() (per HIGHLIGHT_BLOCK_LINES
+        block, cached), or None if content is too large or not JSON-like
+    """
+    if len(content) > MAX_HIGHLIGHT_CHARS:
+        logger.info("Skipping highlighting: %d characters exceeds limit of %d", len(content), MAX_HIGHLIGHT_CHARS)
+        return None
+    if not looks_like_json(content):
+        return None
+    
+    line_count = content.count('\n') + 1
+    if line_count > MAX_HIGHLIGHT_LINES:
+        logger.info("Skipping highlighting: %d lines exceeds limit of %d", line_count, MAX_HIGHLIGHT_LINES)
+        return None
+    return tokenize_json_blocks(content, HIGHLIGHT_BLOCK_LINES)
+
+
 class NanoManApp(ctk.CTk):
     """Main application window for NanoMan API client."""
     
@@ -77,12 +150,32 @@ class NanoManApp(ctk.CTk):
         self.minsize(900, 700)
         
         # History storage
-        self.history = []
+        self.history = deque(maxlen=MAX_HISTORY_ITEMS)  # Oldest entries drop off automatically
         self.load_history()  # Load from file
+        self.history_rows_shown = HISTORY_VISIBLE_ROWS  # Rows that fit; set on resize
+        self.history_first = max(0, len(self.history) - self.history_rows_shown)  # Top visible row
+        
+        # New entries are written by a background thread, off the Tk mainloop
+        self.history_queue = queue.Queue()
+        self.history_writer = threading.Thread(target=self._write_history_lines, daemon=True)
+        self.history_writer.start()
         
         # Current tab
         self.current_tab = "response"
         
+        # One request at a time (double-click / repeated Enter)
+        self.request_in_flight = False
+        
+        # Pending chunked inserts (textbox name -> after_idle id)
+        self.stream_jobs = {}
+        
+        # Highlight blocks not yet tagged (textbox name -> blocks) and debounce timers
+        self.highlight_pending = {}
+        self.highlight_jobs = {}
+        
+        # (method, url, body, headers) -> (result, ranges, time received); memory only, never saved
+        self.response_cache = OrderedDict()
+        
         # Grid layout
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(3, weight=1)  # Content area expands
@@ -92,7 +185,7 @@ class NanoManApp(ctk.CTk):
         # Save history on close
         self.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        logger.info(f"NanoMan v{VERSION} started")
+        logger.info("NanoMan v%s started", VERSION)
     
     def create_widgets(self):
         """Create all UI widgets."""
@@ -241,12 +334,18 @@ class NanoManApp(ctk.CTk):
         self.content_frame.grid_columnconfigure(0, weight=1)
         self.content_frame.grid_rowconfigure(0, weight=1)
         
-        # Create all content widgets (hidden initially except response)
+        # Create content widgets (hidden initially except response).
+        # The other tabs are built the first time they are needed.
         self._create_response_content()
-        self._create_body_content()
-        self._create_headers_content()
-        self._create_presets_content()
-        self._create_history_content()
+        self.tab_frames = {
+            "response": self.response_frame,
+        }
+        self._tab_builders = {
+            "body": self._create_body_content,
+            "headers": self._create_headers_content,
+            "presets": self._create_presets_content,
+            "history": self._create_history_content,
+        }
         
         # 5. Status bar
         self.status_frame = ctk.CTkFrame(self, height=35, fg_color="transparent")
@@ -277,14 +376,48 @@ class NanoManApp(ctk.CTk):
         self.response_frame.grid_columnconfigure(0, weight=1)
         self.response_frame.grid_rowconfigure(0, weight=1)
         
+        # No undo stack: responses are replaced wholesale and can be large
         self.txt_response = ctk.CTkTextbox(
             self.response_frame, 
             font=("Consolas", 13),
-            wrap="word"
+            wrap="word",
+            undo=False,
+            autoseparators=False
         )
         self.txt_response.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self._configure_json_tags(self.txt_response)
+        
+        # Shown only while a truncated response is displayed
+        self.full_response_body = None
+        self.btn_load_full = ctk.CTkButton(
+            self.response_frame,
+            text="Load full response",
+            width=140,
+            height=28,
+            font=("Roboto", 11),
+            fg_color="#3498db",
+            hover_color="#2980b9",
+            command=self.load_full_response
+        )
+        self.btn_load_full.grid(row=1, column=0, padx=5, pady=(0, 5), sticky="e")
+        self.btn_load_full.grid_remove()
         self.txt_response.insert("0.0", "// Response will appear here\n// Press SEND or Enter to make a request\n\n// Quick start:\n// 1. Enter a URL or use Presets tab for templates\n// 2. Select HTTP method\n// 3. Press SEND or Enter\n\n// Try these test APIs:\n// https://httpbin.org/get\n// https://jsonplaceholder.typicode.com/posts/1")
     
+    def _configure_json_tags(self, textbox: ctk.CTkTextbox):
+        """Set up a textbox for apply_json_highlighting (tags + scroll hook)."""
+        # Define tags (colors - aligned with Nano Design System)
+        textbox._textbox.tag_configure("key", foreground=COLORS["warning"])    # Orange for keys
+        textbox._textbox.tag_configure("string", foreground=COLORS["success"]) # Green for strings  
+        textbox._textbox.tag_configure("number", foreground=COLORS["primary"]) # Blue for numbers
+        textbox._textbox.tag_configure("boolean", foreground=COLORS["danger"]) # Red for booleans
+        textbox._textbox.tag_configure("null", foreground="#9b59b6")           # Purple for null
+        
+        # Every view change (wheel, keys, scrollbar, resize) goes through yscrollcommand
+        def on_yview(first, last):
+            textbox._y_scrollbar.set(first, last)
+            self._schedule_visible_highlight(textbox)
+        textbox._textbox.configure(yscrollcommand=on_yview)
+    
     def _create_body_content(self):
         """Create request body tab content."""
         self.body_frame = ctk.CTkFrame(self.content_frame)
@@ -297,7 +430,7 @@ class NanoManApp(ctk.CTk):
             font=("Consolas", 13)
         )
         self.txt_body.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        self.txt_body.insert("0.0", '{\n    "key": "value"\n}')
+        self.txt_body.insert("0.0", DEFAULT_BODY)
         
         self.body_frame.grid_remove()  # Hide initially
     
@@ -313,7 +446,7 @@ class NanoManApp(ctk.CTk):
             font=("Consolas", 13)
         )
         self.txt_headers.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        self.txt_headers.insert("0.0", "Content-Type: application/json")
+        self.txt_headers.insert("0.0", DEFAULT_HEADERS)
         
         self.headers_frame.grid_remove()  # Hide initially
     
@@ -383,11 +516,10 @@ class NanoManApp(ctk.CTk):
         ).pack(pady=(0, 10))
         
         # Template buttons
-        for name in get_api_template_names():
-            template = get_api_template_by_name(name)
+        for template in API_TEMPLATES.values():
             btn = ctk.CTkButton(
                 template_section,
-                text=name,
+                text=template["name"],
                 width=220,
                 height=35,
                 font=("Roboto", 11),
@@ -402,13 +534,20 @@ class NanoManApp(ctk.CTk):
         self.template_examples_frame = ctk.CTkFrame(self.presets_frame)
         self.template_examples_frame.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=5, pady=10)
         
+        self.template_examples_frame.grid_columnconfigure(0, weight=1)
+        
         self.template_examples_label = ctk.CTkLabel(
             self.template_examples_frame,
             text="Select a template to see example endpoints",
             font=("Roboto", 11),
             text_color="gray"
         )
-        self.template_examples_label.pack(pady=10)
+        self.template_examples_label.grid(row=0, column=0, pady=10)
+        
+        # Reused by _show_template_examples (created on first use)
+        self.template_examples_header = None
+        self.template_examples_docs = None
+        self.template_example_rows = []
         
         self.presets_frame.grid_remove()  # Hide initially
     
@@ -417,23 +556,18 @@ class NanoManApp(ctk.CTk):
         preset = get_auth_preset_by_name(preset_name)
         if preset and preset.get("headers"):
             # Get current headers
-            current = self.txt_headers.get("0.0", "end").strip()
-            new_headers = []
+            self._ensure_tab("headers")
+            current = parse_headers(self.txt_headers.get("0.0", "end"))
             
-            # Parse existing headers, remove Authorization if present
-            for line in current.split('\n'):
-                if ':' in line:
-                    key = line.split(':', 1)[0].strip().lower()
-                    if key not in ('authorization', 'x-api-key'):
-                        new_headers.append(line)
-            
-            # Add preset headers
-            for key, value in preset["headers"].items():
-                new_headers.append(f"{key}: {value}")
+            # Drop existing auth headers, then add the preset's
+            headers = {
+                key: value for key, value in current.items()
+                if key.lower() not in ('authorization', 'x-api-key')
+            }
+            headers.update(preset["headers"])
             
             # Update headers textbox
-            self.txt_headers.delete("0.0", "end")
-            self.txt_headers.insert("0.0", '\n'.join(new_headers))
+            self._set_textbox(self.txt_headers, '\n'.join(f"{key}: {value}" for key, value in headers.items()))
             
             # Update description
             desc = preset.get("description", "")
@@ -485,65 +619,80 @@ class NanoManApp(ctk.CTk):
         )
     
     def _show_template_examples(self, template: dict):
-        """Show example endpoints for selected template."""
-        # Clear existing content
-        for widget in self.template_examples_frame.winfo_children():
-            widget.destroy()
-        
-        # Header
-        ctk.CTkLabel(
-            self.template_examples_frame,
-            text=f"{template.get('name', 'API')} - Example Endpoints",
-            font=("Roboto", 12, "bold"),
-            text_color=COLORS["link"]
-        ).pack(pady=(10, 5))
+        """
+        Show example endpoints for selected template.
         
-        if template.get("docs"):
-            ctk.CTkLabel(
+        Header, docs label and example rows are created once and
+        reconfigured for each template; surplus rows are hidden.
+        """
+        if self.template_examples_header is None:
+            self.template_examples_label.grid_remove()
+            self.template_examples_header = ctk.CTkLabel(
+                self.template_examples_frame,
+                font=("Roboto", 12, "bold"),
+                text_color=COLORS["link"]
+            )
+            self.template_examples_header.grid(row=0, column=0, pady=(10, 5))
+            self.template_examples_docs = ctk.CTkLabel(
                 self.template_examples_frame,
-                text=f"Docs: {template['docs']}",
                 font=("Roboto", 10),
                 text_color="gray"
-            ).pack()
+            )
+            self.template_examples_docs.grid(row=1, column=0)
+        
+        # Header
+        self.template_examples_header.configure(text=f"{template.get('name', 'API')} - Example Endpoints")
+        
+        if template.get("docs"):
+            self.template_examples_docs.configure(text=f"Docs: {template['docs']}")
+            self.template_examples_docs.grid()
+        else:
+            self.template_examples_docs.grid_remove()
         
         # Example buttons
         examples = template.get("examples", [])
-        for example in examples:
-            btn_frame = ctk.CTkFrame(self.template_examples_frame, fg_color="transparent")
-            btn_frame.pack(fill="x", padx=10, pady=2)
-            
+        while len(self.template_example_rows) < len(examples):
+            self.template_example_rows.append(self._create_example_row(len(self.template_example_rows)))
+        
+        for row, example in zip(self.template_example_rows, examples):
             method = example.get("method", "GET")
             path = example.get("path", "/")
             desc = example.get("desc", "")
             
-            # Method badge color
-            method_color = {
-                "GET": COLORS["primary"],
-                "POST": COLORS["success"],
-                "PUT": COLORS["warning"],
-                "PATCH": COLORS["warning"],
-                "DELETE": COLORS["danger"],
-            }.get(method, COLORS["neutral"])
-            
-            ctk.CTkLabel(
-                btn_frame,
-                text=method,
-                font=("Consolas", 10, "bold"),
-                text_color=method_color,
-                width=50
-            ).pack(side="left")
-            
-            btn = ctk.CTkButton(
-                btn_frame,
-                text=f"{path}  -  {desc}",
-                font=("Consolas", 10),
-                fg_color="transparent",
-                hover_color="#34495e",
-                text_color="white",
-                anchor="w",
-                command=lambda t=template, e=example: self._load_example(t, e)
-            )
-            btn.pack(side="left", fill="x", expand=True)
+            row["method"].configure(text=method, text_color=_METHOD_COLORS.get(method, COLORS["neutral"]))
+            row["button"].configure(text=f"{path}  -  {desc}")
+            row["item"] = (template, example)
+            row["frame"].grid()
+        
+        for row in self.template_example_rows[len(examples):]:
+            row["frame"].grid_remove()
+    
+    def _create_example_row(self, index: int) -> dict:
+        """Create one reusable example endpoint row (see _show_template_examples)."""
+        btn_frame = ctk.CTkFrame(self.template_examples_frame, fg_color="transparent")
+        btn_frame.grid(row=index + 2, column=0, sticky="ew", padx=10, pady=2)
+        
+        lbl_method = ctk.CTkLabel(
+            btn_frame,
+            text="",
+            font=("Consolas", 10, "bold"),
+            width=50
+        )
+        lbl_method.pack(side="left")
+        
+        row = {"frame": btn_frame, "method": lbl_method, "item": None}
+        row["button"] = ctk.CTkButton(
+            btn_frame,
+            text="",
+            font=("Consolas", 10),
+            fg_color="transparent",
+            hover_color="#34495e",
+            text_color="white",
+            anchor="w",
+            command=lambda r=row: self._load_example(*r["item"])
+        )
+        row["button"].pack(side="left", fill="x", expand=True)
+        return row
     
     def _load_example(self, template: dict, example: dict):
         """Load a specific example endpoint."""
@@ -563,8 +712,14 @@ class NanoManApp(ctk.CTk):
 
     
     def _create_history_content(self):
-        """Create history tab content."""
-        self.history_frame = ctk.CTkScrollableFrame(self.content_frame)
+        """
+        Create history tab content.
+        
+        Only HISTORY_VISIBLE_ROWS row widgets are ever created; scrolling
+        re-binds them to a different slice of self.history. Of those, only
+        as many as fit the frame height are shown (see _on_history_resize).
+        """
+        self.history_frame = ctk.CTkFrame(self.content_frame, fg_color="transparent")
         self.history_frame.grid(row=0, column=0, sticky="nsew")
         self.history_frame.grid_columnconfigure(0, weight=1)
         
@@ -574,149 +729,27 @@ class NanoManApp(ctk.CTk):
             text_color="gray"
         )
         self.lbl_history_empty.grid(row=0, column=0, pady=20)
+        self.history_empty_visible = True  # Avoids a grid call per refresh
         
-        self.history_frame.grid_remove()  # Hide initially
-    
-    def switch_tab(self, tab_key: str):
-        """Switch between tabs."""
-        self.current_tab = tab_key
+        self.history_rows = [self._create_history_row(slot) for slot in range(HISTORY_VISIBLE_ROWS)]
         
-        # Define which tabs are "special" (purple theme)
-        special_tabs = {"presets", "history"}
-        main_tabs = {"response", "body", "headers"}
-        
-        # Update button colors
-        for key, btn in self.tab_buttons.items():
-            if key == tab_key:
-                # Active tab gets highlighted
-                if key in special_tabs:
-                    btn.configure(fg_color="#8e44ad")  # Darker purple for active
-                else:
-                    btn.configure(fg_color="#3498db")  # Blue for active main tabs
-            else:
-                # Inactive tabs
-                if key in special_tabs:
-                    btn.configure(fg_color=COLORS["special"])  # Purple for special
-                else:
-                    btn.configure(fg_color="#2c3e50")  # Gray for main tabs
-        
-        # Hide all frames
-        self.response_frame.grid_remove()
-        self.body_frame.grid_remove()
-        self.headers_frame.grid_remove()
-        self.presets_frame.grid_remove()
-        self.history_frame.grid_remove()
-        
-        # Show selected frame
-        if tab_key == "response":
-            self.response_frame.grid()
-        elif tab_key == "body":
-            self.body_frame.grid()
-        elif tab_key == "headers":
-            self.headers_frame.grid()
-        elif tab_key == "presets":
-            self.presets_frame.grid()
-        elif tab_key == "history":
-            self.history_frame.grid()
-    
-    def apply_json_highlighting(self, textbox: ctk.CTkTextbox, content: str):
-        """Apply basic JSON syntax highlighting with performance limit."""
-        textbox.delete("0.0", "end")
-        textbox.insert("0.0", content)
-        
-        lines = content.split('\n')
-        
-        # Performance limit: skip highlighting for large JSON
-        if len(lines) > MAX_HIGHLIGHT_LINES:
-            logger.info(f"Skipping highlighting: {len(lines)} lines exceeds limit of {MAX_HIGHLIGHT_LINES}")
-            return
+        self.history_scrollbar = ctk.CTkScrollbar(self.history_frame, command=self._scroll_history)
+        self.history_scrollbar.grid(row=0, column=1, rowspan=HISTORY_VISIBLE_ROWS, sticky="ns")
         
-        # Define tags (colors - aligned with Nano Design System)
-        textbox._textbox.tag_configure("key", foreground=COLORS["warning"])    # Orange for keys
-        textbox._textbox.tag_configure("string", foreground=COLORS["success"]) # Green for strings  
-        textbox._textbox.tag_configure("number", foreground=COLORS["primary"]) # Blue for numbers
-        textbox._textbox.tag_configure("boolean", foreground=COLORS["danger"]) # Red for booleans
-        textbox._textbox.tag_configure("null", foreground="#9b59b6")           # Purple for null
+        self.history_frame.bind("<Configure>", self._on_history_resize)
+        self.refresh_visible_rows()
         
-        # Apply highlighting
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            # Keys (before colon)
-            for match in re.finditer(r'"([^"]+)"\s*:', line):
-                start = f"{line_num}.{match.start()}"
-                end = f"{line_num}.{match.end()-1}"
-                textbox._textbox.tag_add("key", start, end)
-            
-            # String values (after colon)
-            for match in re.finditer(r':\s*"([^"]*)"', line):
-                start = f"{line_num}.{match.start() + len(match.group(0)) - len(match.group(1)) - 1}"
-                end = f"{line_num}.{match.end()}"
-                textbox._textbox.tag_add("string", start, end)
-            
-            # Numbers
-            for match in re.finditer(r':\s*(-?\d+\.?\d*)', line):
-                start = f"{line_num}.{match.start(1)}"
-                end = f"{line_num}.{match.end(1)}"
-                textbox._textbox.tag_add("number", start, end)
-            
-            # Booleans
-            for match in re.finditer(r'\b(true|false)\b', line, re.IGNORECASE):
-                start = f"{line_num}.{match.start()}"
-                end = f"{line_num}.{match.end()}"
-                textbox._textbox.tag_add("boolean", start, end)
-            
-            # Null
-            for match in re.finditer(r'\bnull\b', line, re.IGNORECASE):
-                start = f"{line_num}.{match.start()}"
-                end = f"{line_num}.{match.end()}"
-                textbox._textbox.tag_add("null", start, end)
-    
-    def clear_response(self):
-        """Clear the response text."""
-        self.txt_response.delete("0.0", "end")
-        self.txt_response.insert("0.0", "// Cleared")
-        self.lbl_status.configure(text="Response cleared.", text_color="gray")
+        self.history_frame.grid_remove()  # Hide initially
     
-    def add_to_history(self, method: str, url: str, status_code: int, elapsed: float):
-        """
-        Add a request to history.
-        
-        Security Note: Only method, URL, status, elapsed time, and timestamp are saved.
-        Headers and request body are intentionally NOT persisted to prevent
-        leaking sensitive data (Authorization tokens, API keys, etc.).
-        """
-        # Remove empty label if exists
-        if hasattr(self, 'lbl_history_empty') and self.lbl_history_empty.winfo_exists():
-            self.lbl_history_empty.destroy()
-        
-        # Add to list
-        self.history.append({
-            "method": method,
-            "url": url,
-            "status": status_code,
-            "elapsed": elapsed,
-            "time": datetime.now().strftime("%H:%M:%S")
-        })
-        
-        # Create history item
-        row = len(self.history) - 1
-        
-        # Color based on status
-        if 200 <= status_code < 300:
-            color = "#27ae60"
-        elif 300 <= status_code < 400:
-            color = "#f39c12"
-        else:
-            color = "#e74c3c"
-        
+    def _create_history_row(self, slot: int) -> dict:
+        """Create one reusable history row (filled in by refresh_visible_rows)."""
         item_frame = ctk.CTkFrame(self.history_frame, fg_color="#2a2d2e")
-        item_frame.grid(row=row, column=0, sticky="ew", pady=2)
         item_frame.grid_columnconfigure(1, weight=1)
         
         # Method badge
         lbl_method = ctk.CTkLabel(
             item_frame,
-            text=method,
+            text="",
             width=60,
             font=("Consolas", 11, "bold"),
             fg_color="#34495e",
@@ -725,10 +758,9 @@ class NanoManApp(ctk.CTk):
         lbl_method.grid(row=0, column=0, padx=5, pady=5)
         
         # URL (truncated)
-        display_url = url[:60] + "..." if len(url) > 60 else url
         lbl_url = ctk.CTkLabel(
             item_frame,
-            text=display_url,
+            text="",
             font=("Consolas", 11),
             anchor="w"
         )
@@ -737,17 +769,16 @@ class NanoManApp(ctk.CTk):
         # Status
         lbl_status = ctk.CTkLabel(
             item_frame,
-            text=str(status_code),
+            text="",
             width=50,
-            font=("Consolas", 11, "bold"),
-            text_color=color
+            font=("Consolas", 11, "bold")
         )
         lbl_status.grid(row=0, column=2, padx=5, pady=5)
         
         # Time
         lbl_time = ctk.CTkLabel(
             item_frame,
-            text=f"{elapsed:.2f}s",
+            text="",
             width=60,
             font=("Consolas", 10),
             text_color="gray"
@@ -763,126 +794,528 @@ class NanoManApp(ctk.CTk):
             font=("Roboto", 10),
             fg_color="#3498db",
             hover_color="#2980b9",
-            command=lambda u=url, m=method: self.load_from_history(m, u)
+            command=lambda s=slot: self._load_history_row(s)
         )
         btn_load.grid(row=0, column=4, padx=5, pady=5)
         
+        # Mouse wheel scrolls the list (Button-4/5 on Linux)
+        for widget in (item_frame, lbl_method, lbl_url, lbl_status, lbl_time):
+            widget.bind("<MouseWheel>", self._on_history_wheel)
+            widget.bind("<Button-4>", self._on_history_wheel)
+            widget.bind("<Button-5>", self._on_history_wheel)
+        
+        return {
+            "frame": item_frame,
+            "method": lbl_method,
+            "url": lbl_url,
+            "status": lbl_status,
+            "elapsed": lbl_time,
+        }
+    
+    def refresh_visible_rows(self):
+        """Show the slice of self.history starting at self.history_first."""
+        total = len(self.history)
+        shown = self.history_rows_shown
+        max_first = max(0, total - shown)
+        self.history_first = min(max(self.history_first, 0), max_first)
+        
+        for slot, row in enumerate(self.history_rows):
+            index = self.history_first + slot
+            if index >= total or slot >= shown:
+                row["frame"].grid_remove()
+                continue
+            
+            item = self.history[index]
+            url = item.get("url", "")
+            status_code = item.get("status", 0)
+            
+            color = _status_color(status_code)
+            
+            row["method"].configure(text=item.get("method", ""))
+            row["url"].configure(text=url[:60] + "..." if len(url) > 60 else url)
+            row["status"].configure(text=str(status_code), text_color=color)
+            row["elapsed"].configure(text=f"{item.get('elapsed', 0):.2f}s")
+            row["frame"].grid(row=slot, column=0, sticky="ew", pady=2)
+        
+        if bool(total) == self.history_empty_visible:
+            if total:
+                self.lbl_history_empty.grid_remove()
+            else:
+                self.lbl_history_empty.grid()
+            self.history_empty_visible = not total
+        
+        if total:
+            self.history_scrollbar.set(self.history_first / total,
+                                       min(1.0, (self.history_first + shown) / total))
+        else:
+            self.history_scrollbar.set(0.0, 1.0)
+    
+    def _on_history_resize(self, event):
+        """Show as many pooled rows as fit the history frame's height."""
+        row_height = HISTORY_ROW_HEIGHT * ctk.ScalingTracker.get_widget_scaling(self.history_frame)
+        shown = max(1, min(HISTORY_VISIBLE_ROWS, int(event.height // row_height)))
+        if shown == self.history_rows_shown:
+            return
+        # Stay pinned to the newest entries if they were in view
+        at_bottom = self.history_first + self.history_rows_shown >= len(self.history)
+        self.history_rows_shown = shown
+        if at_bottom:
+            self.history_first = max(0, len(self.history) - shown)
+        self.refresh_visible_rows()
+    
+    def _scroll_history(self, action: str, amount, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', delta, 'units')."""
+        if action == "moveto":
+            self.history_first = round(float(amount) * len(self.history))
+        else:
+            self.history_first += int(amount)
+        self.refresh_visible_rows()
+    
+    def _on_history_wheel(self, event):
+        """Scroll the history list by mouse wheel."""
+        if event.num == 4 or event.delta > 0:
+            self._scroll_history("scroll", -1)
+        else:
+            self._scroll_history("scroll", 1)
+    
+    def _load_history_row(self, slot: int):
+        """Load the history item currently shown in the given row."""
+        index = self.history_first + slot
+        if index < len(self.history):
+            item = self.history[index]
+            self.load_from_history(item.get("method", "GET"), item.get("url", ""))
+    
+    def switch_tab(self, tab_key: str):
+        """Switch between tabs (only the old and new tab are touched)."""
+        if tab_key == self.current_tab:
+            return
+        self._ensure_tab(tab_key)
+        previous, self.current_tab = self.current_tab, tab_key
+        
+        # Update button colors
+        self.tab_buttons[previous].configure(fg_color=self._tab_color(previous, active=False))
+        self.tab_buttons[tab_key].configure(fg_color=self._tab_color(tab_key, active=True))
+        
+        # Swap content frames
+        self.tab_frames[previous].grid_remove()
+        self.tab_frames[tab_key].grid()
+    
+    def _ensure_tab(self, tab_key: str):
+        """Build a lazily created tab (all but response) on first use."""
+        if tab_key not in self.tab_frames:
+            self._tab_builders[tab_key]()
+            self.tab_frames[tab_key] = getattr(self, f"{tab_key}_frame")
+    
+    @staticmethod
+    def _tab_color(tab_key: str, active: bool) -> str:
+        """Tab button color; presets/history are "special" (purple theme)."""
+        if tab_key in ("presets", "history"):
+            return "#8e44ad" if active else COLORS["special"]  # Darker purple for active
+        return "#3498db" if active else "#2c3e50"  # Blue active, gray inactive
+    
+    def apply_json_highlighting(self, textbox: ctk.CTkTextbox, content: str, ranges=None):
+        """
+        Apply basic JSON syntax highlighting with performance limit.
+        
+        The textbox must have been set up with _configure_json_tags().
+        Only the visible blocks are tagged now; the rest follow on scroll.
+        
+        Args:
+            textbox: Target textbox
+            content: JSON text to display
+            ranges: Token ranges from json_highlight_ranges(); computed here if omitted
+        """
+        self._set_textbox(textbox, content)
+        
+        if ranges is None:
+            ranges = json_highlight_ranges(content)
+            if ranges is None:
+                return
+        
+        self.highlight_pending[str(textbox)] = list(ranges)  # Copy: blocks are cleared as applied
+        self._highlight_visible(textbox)
+    
+    def _schedule_visible_highlight(self, textbox: ctk.CTkTextbox):
+        """Debounce _highlight_visible while the view is moving."""
+        key = str(textbox)
+        if key in self.highlight_pending and key not in self.highlight_jobs:
+            self.highlight_jobs[key] = self.after(50, self._highlight_visible, textbox)
+    
+    def _highlight_visible(self, textbox: ctk.CTkTextbox):
+        """
+        Tag the pending highlight blocks in (and just below) the visible lines.
+        
+        While blocks remain, one more is tagged per run and the next run is
+        scheduled, so the rest of the document is finished in small steps
+        between input events.
+        """
+        key = str(textbox)
+        self.highlight_jobs.pop(key, None)
+        blocks = self.highlight_pending.get(key)
+        if blocks is None:
+            return
+        
+        tb = textbox._textbox
+        first_line = int(tb.index("@0,0").split(".")[0])
+        last_line = int(tb.index(f"@0,{tb.winfo_height()}").split(".")[0])
+        first_block = (first_line - 1) // HIGHLIGHT_BLOCK_LINES
+        last_block = (last_line - 1) // HIGHLIGHT_BLOCK_LINES + 1  # One block of lookahead
+        
+        visible = [i for i in range(first_block, min(last_block + 1, len(blocks))) if blocks[i] is not None]
+        background = next((i for i, block in enumerate(blocks) if block is not None and i not in visible), None)
+        if background is not None:
+            visible.append(background)
+        
+        # One tag_add call per tag and block
+        for index in visible:
+            for tag, indices in blocks[index].items():
+                if indices:
+                    tb.tag_add(tag, *indices)
+            blocks[index] = None
+        
+        if any(blocks):
+            self.highlight_jobs[key] = self.after(1, self._highlight_visible, textbox)
+        else:
+            del self.highlight_pending[key]
+    
+    def _set_textbox(self, textbox: ctk.CTkTextbox, content: str):
+        """Replace all textbox content in one Tk call (drops old tags too)."""
+        job = self.stream_jobs.pop(str(textbox), None)
+        if job is not None:
+            self.after_cancel(job)  # Newer content wins over a pending stream
+        job = self.highlight_jobs.pop(str(textbox), None)
+        if job is not None:
+            self.after_cancel(job)
+        self.highlight_pending.pop(str(textbox), None)  # Old tags go with the old text
+        textbox._textbox.replace("1.0", "end", content)
+    
+    def _stream_textbox(self, textbox: ctk.CTkTextbox, content: str):
+        """
+        Replace textbox content, inserting large text in chunks.
+        
+        Each STREAM_CHUNK_CHARS piece is inserted from after_idle, so the
+        window keeps repainting and handling input between pieces.
+        """
+        if len(content) <= STREAM_THRESHOLD_CHARS:
+            self._set_textbox(textbox, content)
+            return
+        self._set_textbox(textbox, content[:STREAM_CHUNK_CHARS])
+        self.stream_jobs[str(textbox)] = self.after_idle(
+            self._stream_chunk, textbox, content, STREAM_CHUNK_CHARS
+        )
+    
+    def _stream_chunk(self, textbox: ctk.CTkTextbox, content: str, start: int):
+        """Append one chunk and schedule the next (see _stream_textbox)."""
+        end = start + STREAM_CHUNK_CHARS
+        textbox._textbox.insert("end", content[start:end])
+        if end < len(content):
+            self.stream_jobs[str(textbox)] = self.after_idle(self._stream_chunk, textbox, content, end)
+        else:
+            del self.stream_jobs[str(textbox)]
+    
+    def _show_response_body(self, body: str):
+        """Show a plain response body, truncated to MAX_DISPLAY_CHARS."""
+        if len(body) <= MAX_DISPLAY_CHARS:
+            self._stream_textbox(self.txt_response, body)
+            return
+        self.full_response_body = body
+        self._set_textbox(
+            self.txt_response,
+            f"{body[:MAX_DISPLAY_CHARS]}\n\n// [truncated: showing {MAX_DISPLAY_CHARS:,} of {len(body):,} characters]"
+        )
+        self.btn_load_full.grid()
+    
+    def _discard_full_response(self):
+        """Forget a truncated response body and hide "Load full"."""
+        self.full_response_body = None
+        self.btn_load_full.grid_remove()
+    
+    def load_full_response(self):
+        """Replace the truncated response with the full body."""
+        body = self.full_response_body
+        self._discard_full_response()
+        if body is not None:
+            self._stream_textbox(self.txt_response, body)
+    
+    def clear_response(self):
+        """Clear the response text."""
+        self._discard_full_response()
+        self._set_textbox(self.txt_response, "// Cleared")
+        self.lbl_status.configure(text="Response cleared.", text_color="gray")
+    
+    def add_to_history(self, method: str, url: str, status_code: int, elapsed: float):
+        """
+        Add a request to history.
+        
+        Security Note: Only method, URL, status, elapsed time, and timestamp are saved.
+        Headers and request body are intentionally NOT persisted to prevent
+        leaking sensitive data (Authorization tokens, API keys, etc.).
+        """
+        # Follow new items unless the user scrolled up
+        at_bottom = self.history_first + self.history_rows_shown >= len(self.history)
+        if not at_bottom and len(self.history) == self.history.maxlen:
+            self.history_first -= 1  # Oldest item is evicted; keep the same rows in view
+        
+        # Add to list and persist right away (crash-safe, append-only)
+        entry = {
+            "method": sys.intern(method),  # A handful of values, shared by all entries
+            "url": url,
+            "status": status_code,
+            "elapsed": elapsed,
+            "time": datetime.now().strftime("%H:%M:%S")
+        }
+        self.history.append(entry)
+        self._append_history(entry)
+        
+        if at_bottom:
+            self.history_first = max(0, len(self.history) - self.history_rows_shown)
+        if "history" in self.tab_frames:
+            self.refresh_visible_rows()
+        
         # Update count
         self.lbl_count.configure(text=f"Requests: {len(self.history)}")
     
     def load_from_history(self, method: str, url: str):
-        """Load a request from history."""
+        """
+        Load a request from history (and its last response, if cached).
+        
+        History does not keep bodies or headers, so a cached response is
+        only shown if the current Body and Headers text match the request
+        that produced it.
+        """
         self.method_var.set(method)
         self.entry_url.delete(0, "end")
         self.entry_url.insert(0, url)
         self.switch_tab("response")
-        self.lbl_status.configure(text=f"Loaded from history: {method} {url[:50]}...", text_color="#3498db")
+        
+        key = (method, url) + self._request_texts(method)
+        cached = self.response_cache.get(key)
+        if cached is None:
+            self.lbl_status.configure(text=f"Loaded from history: {method} {url[:50]}...", text_color="#3498db")
+            return
+        
+        # Show the last response without re-sending; SEND fetches a fresh one
+        result, ranges, received = cached
+        self.response_cache.move_to_end(key)
+        self._discard_full_response()
+        self._show_response(result, ranges)
+        self.lbl_status.configure(
+            text=f"Last response ({received}): {result.status_code} {result.reason} | Press SEND to refresh",
+            text_color="#3498db"
+        )
+    
+    def _cache_response(self, key: tuple, result: ApiResult, ranges):
+        """
+        Remember a response for load_from_history (bounded, in memory only).
+        
+        Args:
+            key: (method, url, body text, headers text) of the request sent
+        """
+        if len(result.body) > MAX_DISPLAY_CHARS:
+            return  # Not worth holding on to
+        self.response_cache[key] = (result, ranges, datetime.now().strftime("%H:%M:%S"))
+        self.response_cache.move_to_end(key)
+        if len(self.response_cache) > RESPONSE_CACHE_SIZE:
+            self.response_cache.popitem(last=False)
     
     def send_request_thread(self):
         """Start request in a separate thread to avoid UI freeze."""
+        # Enter in the URL field bypasses the disabled SEND button
+        if self.request_in_flight:
+            return
+        self.request_in_flight = True
         self.lbl_status.configure(text="Sending request...", text_color="orange")
         self.btn_send.configure(state="disabled", text="...")
-        threading.Thread(target=self._execute_request, daemon=True).start()
-    
-    def _execute_request(self):
-        """Execute the API request (runs in background thread)."""
+        
+        # Read widgets here - Tk must only be touched from the main thread
         method = self.method_var.get()
         url = self.entry_url.get().strip()
-        payload = self.txt_body.get("0.0", "end").strip()
-        headers_text = self.txt_headers.get("0.0", "end").strip()
+        payload, headers_text = self._request_texts(method)
         
+        threading.Thread(
+            target=self._execute_request,
+            args=(method, url, payload, headers_text),
+            daemon=True
+        ).start()
+    
+    def _request_texts(self, method: str) -> tuple:
+        """
+        Current (body, headers) text; defaults for tabs not built yet.
+        
+        The body is what request_payload() sends for method, so the
+        response cache key matches the request actually made.
+        """
+        if "body" in self.tab_frames:
+            payload = self.txt_body.get("0.0", "end").strip()
+        else:
+            payload = DEFAULT_BODY
+        payload = request_payload(method, payload)
+        if "headers" in self.tab_frames:
+            headers_text = self.txt_headers.get("0.0", "end").strip()
+        else:
+            headers_text = DEFAULT_HEADERS
+        return payload, headers_text
+    
+    def _execute_request(self, method: str, url: str, payload: str, headers_text: str):
+        """Execute the API request (runs in background thread)."""
         # Parse headers
         headers = parse_headers(headers_text)
         
         # Allow body for all methods (ElasticSearch uses GET with body)
-        # Trust the developer to know what they're doing
+        # Trust the developer to know what they're doing - only the
+        # untouched placeholder is left out on GET (see request_payload)
         
         # Make request
         result = send_api_request(method, url, payload, headers)
         
+        # Tokenize here so the main thread only inserts text and adds tags
+        ranges = None
+        if result.success and result.is_json:
+            ranges = json_highlight_ranges(result.body)
+        
         # Update UI (thread-safe via after)
-        self.after(0, lambda: self._update_ui(result, method, url))
+        cache_key = (method, url, payload, headers_text)
+        self.after(0, lambda: self._update_ui(result, method, url, ranges, cache_key))
     
-    def _update_ui(self, result: dict, method: str, url: str):
-        """Update UI with request result."""
+    def _update_ui(self, result: ApiResult, method: str, url: str, ranges=None, cache_key=None):
+        """
+        Update UI with request result.
+        
+        Args:
+            ranges: Precomputed JSON token ranges
+            cache_key: Response cache key (see _cache_response); not cached if None
+        """
+        self.request_in_flight = False
         self.btn_send.configure(state="normal", text="SEND")
+        self._discard_full_response()
         
-        if result.get("success"):
-            status_code = result["status_code"]
-            reason = result["reason"]
-            elapsed = result["elapsed_seconds"]
-            is_json = result.get("is_json", False)
-            
-            # Color based on status
-            if 200 <= status_code < 300:
-                color = "#27ae60"  # Green
-            elif 300 <= status_code < 400:
-                color = "#f39c12"  # Orange
-            else:
-                color = "#e74c3c"  # Red
+        if result.success:
+            status_code = result.status_code
+            reason = result.reason
+            elapsed = result.elapsed_seconds
             
             self.lbl_status.configure(
                 text=f"Status: {status_code} {reason} | Time: {elapsed:.3f}s",
-                text_color=color
+                text_color=_status_color(status_code)
             )
-            
-            # Show response with syntax highlighting if JSON
-            if is_json:
-                self.apply_json_highlighting(self.txt_response, result["body"])
-            else:
-                self.txt_response.delete("0.0", "end")
-                self.txt_response.insert("0.0", result["body"])
+            self._show_response(result, ranges)
             
             # Add to history
             self.add_to_history(method, url, status_code, elapsed)
+            if cache_key is not None:
+                self._cache_response(cache_key, result, ranges)
             
             # Switch to response tab
             self.switch_tab("response")
         else:
             # Error
             self.lbl_status.configure(
-                text=f"Error: {result['error'][:80]}...",
-                text_color="#e74c3c"
+                text=f"Error: {result.error[:80]}...",
+                text_color=_STATUS_ERROR_COLOR
             )
-            self.txt_response.delete("0.0", "end")
-            self.txt_response.insert("0.0", f"Error:\n{result['error']}")
+            self._set_textbox(self.txt_response, f"Error:\n{result.error}")
             self.switch_tab("response")
     
+    def _show_response(self, result: ApiResult, ranges=None):
+        """Show a successful response body, with syntax highlighting if JSON."""
+        if ranges is not None:
+            self.apply_json_highlighting(self.txt_response, result.body, ranges)
+        else:
+            self._show_response_body(result.body)
+    
     def load_history(self):
-        """Load history from JSON file."""
+        """Load history from the JSONL file (or migrate the legacy JSON file)."""
+        self.history_file_lines = 0  # Lines in HISTORY_FILE, used to decide compaction
         try:
             if HISTORY_FILE.exists():
-                with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+                torn = False
+                # Bytes, decoded per line: a crash can cut a multibyte character
+                with open(HISTORY_FILE, 'rb') as f:
+                    for line in f:
+                        self.history_file_lines += 1
+                        torn = not line.endswith(b"\n")
+                        try:
+                            self.history.append(json_loads(line.decode('utf-8')))
+                        except ValueError:  # JSONDecodeError or UnicodeDecodeError
+                            continue  # Skip a line torn by a crash mid-write
+                if torn:
+                    # Drop the fragment, or the next append would extend it
+                    self.save_history()
+                logger.info("Loaded %d history items", len(self.history))
+            elif LEGACY_HISTORY_FILE.exists():
+                with open(LEGACY_HISTORY_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.history = data.get('history', [])[-MAX_HISTORY_ITEMS:]
-                    logger.info(f"Loaded {len(self.history)} history items")
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Could not load history: {e}")
-            self.history = []
+                    self.history.extend(data.get('history', []))
+                self.save_history()
+                if HISTORY_FILE.exists():
+                    LEGACY_HISTORY_FILE.unlink()
+                logger.info("Migrated %d history items to %s", len(self.history), HISTORY_FILE.name)
+        except (ValueError, IOError) as e:
+            logger.warning("Could not load history: %s", e)
+            self.history.clear()
+    
+    def _append_history(self, entry: dict):
+        """Queue one history entry for appending to HISTORY_FILE (no full rewrite)."""
+        self.history_queue.put(json_dumps_line(entry))
+    
+    def _write_history_lines(self):
+        """
+        Background writer: append queued history lines until a None sentinel.
+        
+        The only thread that appends to HISTORY_FILE, so no locking is needed.
+        Lines queued while a write is in progress go out in the next batch.
+        history_file_lines counts only lines actually written; the main
+        thread reads it in on_close once this thread has finished.
+        """
+        while True:
+            lines = [self.history_queue.get()]
+            while not self.history_queue.empty():
+                lines.append(self.history_queue.get_nowait())
+            stop = None in lines
+            lines = [line for line in lines if line is not None]
+            if lines:
+                try:
+                    with open(HISTORY_FILE, 'ab') as f:
+                        f.write(b"".join(lines))
+                    self.history_file_lines += len(lines)
+                except IOError as e:
+                    logger.error("Could not save history entry: %s", e)
+            if stop:
+                return
     
     def save_history(self):
-        """Save history to JSON file."""
+        """Rewrite HISTORY_FILE with the current (bounded) history."""
+        # Write a sibling file and swap it in: a crash mid-write must not
+        # leave a truncated history behind
+        tmp_file = HISTORY_FILE.with_suffix(".jsonl.tmp")
         try:
-            # Keep only last MAX_HISTORY_ITEMS
-            history_to_save = self.history[-MAX_HISTORY_ITEMS:]
-            with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-                json.dump({'history': history_to_save}, f, indent=2, ensure_ascii=False)
-            logger.info(f"Saved {len(history_to_save)} history items")
+            with open(tmp_file, 'wb') as f:
+                f.write(b"".join(map(json_dumps_line, self.history)))
+            os.replace(tmp_file, HISTORY_FILE)
+            self.history_file_lines = len(self.history)
+            logger.info("Saved %d history items", len(self.history))
         except IOError as e:
-            logger.error(f"Could not save history: {e}")
+            logger.error("Could not save history: %s", e)
     
     def on_close(self):
         """Handle window close event."""
-        self.save_history()
+        # Flush queued entries; only compact once the file has grown
+        self.history_queue.put(None)
+        self.history_writer.join(HISTORY_FLUSH_TIMEOUT)
+        if not self.history_writer.is_alive() and self.history_file_lines > 2 * MAX_HISTORY_ITEMS:
+            self.save_history()
         self.destroy()
 
 
 def main():
     """Application entry point."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    # Log output is opt-in (NANOMAN_DEBUG=1); without a handler only
+    # warnings and errors reach stderr, via logging's last-resort handler
+    if os.environ.get("NANOMAN_DEBUG"):
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
     app = NanoManApp()
     app.mainloop()
 
@@ -0,0 +1,114 @@
+"""
+NanoMan Highlight Tests
+Tests for the JSON syntax highlighting tokenizer.
+Run with: python -m pytest tests/ -v
+"""
+
+import json
+import unittest
+from src.highlight import tokenize_json, tokenize_json_blocks, looks_like_json, JSON_TAGS, _walk_json, _scan_json
+from src.logic import format_json
+
+
+class TestTokenizeJSON(unittest.TestCase):
+    """Tests for tokenize_json range output."""
+    
+    def test_token_classes(self):
+        """Test keys, strings, numbers, booleans and null are classified."""
+        ranges = tokenize_json('{"a": "b", "n": -1.5e3, "t": true, "f": false, "z": null}')
+        
+        self.assertEqual(ranges["key"][:2], ("1.1", "1.4"))
+        self.assertEqual(ranges["string"], ("1.6", "1.9"))
+        self.assertEqual(ranges["number"], ("1.16", "1.22"))
+        self.assertEqual(len(ranges["boolean"]), 4)
+        self.assertEqual(ranges["null"], ("1.52", "1.56"))
+        self.assertEqual(set(ranges), set(JSON_TAGS))
+    
+    def test_multiline_indices(self):
+        """Test indices use Tk line.column form across lines."""
+        content = '{\n    "id": 7,\n    "tags": [1, 2]\n}'
+        ranges = tokenize_json(content)
+        
+        self.assertEqual(ranges["key"], ("2.4", "2.8", "3.4", "3.10"))
+        self.assertEqual(ranges["number"], ("2.10", "2.11", "3.13", "3.14", "3.16", "3.17"))
+    
+    def test_literals_inside_strings_ignored(self):
+        """Test true/null/digits and escaped quotes inside strings stay strings."""
+        ranges = tokenize_json('{"msg": "say \\"true\\" or null 42"}')
+        
+        self.assertEqual(ranges["string"], ("1.8", "1.33"))
+        self.assertEqual(ranges["boolean"], ())
+        self.assertEqual(ranges["null"], ())
+        self.assertEqual(ranges["number"], ())
+    
+    def test_unterminated_string_runs_to_line_end(self):
+        """Test a malformed string is tagged to end of line, in linear time."""
+        ranges = tokenize_json('["ab\\"c\n  1]')
+        
+        self.assertEqual(ranges["string"], ("1.1", "1.7"))
+        self.assertEqual(ranges["number"], ("2.2", "2.3"))
+        
+        pathological = '["' + '\\"' * 100000
+        self.assertEqual(tokenize_json(pathological)["string"], ("1.1", "1.%d" % len(pathological)))
+    
+    def test_empty_content(self):
+        """Test empty input yields empty ranges for every tag."""
+        self.assertEqual(dict(tokenize_json("")), {tag: () for tag in JSON_TAGS})
+    
+    def test_structural_walk_matches_scan(self):
+        """Test the parsed-document walk gives the same ranges as the regex scan."""
+        data = {"a": [1, -2.5, {"b": None}], "c": "x \"q\" \u00e9", "d": {}, "e": [], "f": True, "g": [1e100, 1.5e-7]}
+        content = format_json(json.dumps(data))
+        
+        self.assertIsNotNone(_walk_json(content))
+        self.assertEqual(_walk_json(content), _scan_json(content))
+    
+    def test_structural_walk_rejects_other_layouts(self):
+        """Test bodies not in format_json layout are left to the scanner."""
+        self.assertIsNone(_walk_json('{\n    "a": [1, 2]\n}'))
+        self.assertIsNone(_walk_json('{\n  "a": 1\n}'))
+        self.assertIsNone(_walk_json('{\n    "a": 1,\n}'))
+    
+    def test_blocks_by_line(self):
+        """Test ranges are grouped into blocks of lines, keeping pairs intact."""
+        content = format_json(json.dumps({"k%d" % i: i for i in range(5)}))
+        blocks = tokenize_json_blocks(content, 3)
+        
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual(blocks[0]["key"], ("2.4", "2.8", "3.4", "3.8"))
+        self.assertEqual(blocks[1]["number"], ("4.10", "4.11", "5.10", "5.11", "6.10", "6.11"))
+        self.assertEqual(blocks[1]["null"], ())
+    
+    def test_blocks_are_cached_and_read_only(self):
+        """Test block results are reused for identical content."""
+        content = format_json(json.dumps({"k%d" % i: i for i in range(5)}))
+        blocks = tokenize_json_blocks(content, 3)
+        
+        self.assertIs(tokenize_json_blocks(content, 3), blocks)
+        self.assertEqual(
+            {tag: sum((b[tag] for b in blocks), ()) for tag in JSON_TAGS},
+            dict(tokenize_json(content)),
+        )
+        with self.assertRaises(TypeError):
+            blocks[0]["key"] = ()
+    
+    def test_looks_like_json(self):
+        """Test the pre-check accepts objects/arrays and rejects other bodies."""
+        self.assertTrue(looks_like_json('{"a": 1}'))
+        self.assertTrue(looks_like_json('\n  [1, 2]'))
+        self.assertFalse(looks_like_json('<!DOCTYPE html><html></html>'))
+        self.assertFalse(looks_like_json('Internal Server Error'))
+        self.assertFalse(looks_like_json(''))
+    
+    def test_repeat_content_is_cached(self):
+        """Test identical content reuses the cached, read-only result."""
+        content = '{"cached": [1, 2, 3]}'
+        first = tokenize_json(content)
+        
+        self.assertIs(tokenize_json(content), first)
+        with self.assertRaises(TypeError):
+            first["key"] = ()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -4,8 +4,16 @@ Tests for URL validation, JSON formatting, and request handling.
 Run with: python -m pytest tests/ -v
 """
 
+import json
 import unittest
-from src.logic import validate_url, format_json, parse_headers
+import requests
+import urllib3
+from unittest import mock
+from src import logic
+from src.logic import (
+    validate_url, validate_urls, format_json, parse_headers, send_api_request,
+    MAX_URL_LENGTH, json_dumps_line, json_loads,
+)
 
 
 class TestURLValidation(unittest.TestCase):
@@ -77,6 +85,53 @@ class TestURLValidation(unittest.TestCase):
             with self.subTest(url=url):
                 self.assertFalse(validate_url(url), f"Should be rejected: {url}")
 
+    def test_invalid_hostname_labels_rejected(self):
+        """Test hostname label rules (empty, hyphen edges, too long)."""
+        bad_urls = [
+            "http://a..b",
+            "http://example.com.",
+            "http://-example.com",
+            "http://example-.com",
+            "http://" + "a" * 64 + ".com",
+        ]
+        for url in bad_urls:
+            with self.subTest(url=url):
+                self.assertFalse(validate_url(url), f"Should be rejected: {url}")
+
+    def test_invalid_ipv4_rejected(self):
+        """Test IPv4 hosts with out-of-range octets are rejected."""
+        bad_urls = [
+            "http://999.999.999.999",
+            "http://256.0.0.1/api",
+            "http://10.0.0.300:8080",
+        ]
+        for url in bad_urls:
+            with self.subTest(url=url):
+                self.assertFalse(validate_url(url), f"Should be rejected: {url}")
+        self.assertTrue(validate_url("http://10.0.0.255:8080/api"))
+
+    def test_long_adversarial_url_rejected(self):
+        """Security: Long non-matching hostnames must not backtrack (ReDoS)."""
+        self.assertFalse(validate_url("http://" + "a" * 2000 + "!"))
+        self.assertFalse(validate_url("http://" + "a-" * 1000 + "!"))
+
+    def test_oversized_url_rejected(self):
+        """Test URLs over MAX_URL_LENGTH are rejected."""
+        base = "https://example.com/"
+        self.assertTrue(validate_url(base + "a" * (MAX_URL_LENGTH - len(base))))
+        self.assertFalse(validate_url(base + "a" * MAX_URL_LENGTH))
+
+    def test_validate_urls_bulk(self):
+        """Test bulk validation keeps input order and matches validate_url."""
+        urls = ["https://example.com", "javascript:alert(1)", "http://localhost:8000", ""]
+        self.assertEqual(validate_urls(urls), [True, False, True, False])
+        self.assertEqual(validate_urls(iter(urls)), [validate_url(u) for u in urls])
+
+    def test_scheme_is_case_insensitive(self):
+        """Test uppercase schemes still pass the fast-path prefix check."""
+        self.assertTrue(validate_url("HTTPS://EXAMPLE.COM/API"))
+        self.assertTrue(validate_url("Http://localhost:8000"))
+
 
 class TestJSONFormatting(unittest.TestCase):
     """Tests for JSON formatting."""
@@ -102,6 +157,43 @@ class TestJSONFormatting(unittest.TestCase):
         self.assertEqual(format_json(""), "")
         self.assertEqual(format_json(None), None)
 
+    def test_format_matches_stdlib_layout(self):
+        """Test output is identical to json.dumps(indent=4) (orjson or not)."""
+        raw = '{"a":[],"b":{"c":[1,2.5,{"d":null}]},"e":"\u00e9\\n\\"x","f":true}'
+        expected = json.dumps(json.loads(raw), indent=4, ensure_ascii=False)
+        self.assertEqual(format_json(raw), expected)
+
+    def test_format_keeps_big_integers_exact(self):
+        """Test integers beyond 64 bits are not rounded to floats."""
+        pretty = format_json('{"id": 123456789012345678901234567890}')
+        self.assertIn("123456789012345678901234567890", pretty)
+
+    def test_format_keeps_big_negative_integers_exact(self):
+        """Test 19-digit integers below -2**63 are not rounded to floats."""
+        self.assertEqual(format_json('-9999999999999999999'), '-9999999999999999999')
+        self.assertIn("-9223372036854775809", format_json('{"id": -9223372036854775809}'))
+    
+    def test_format_float_spelling_matches_stdlib(self):
+        """Test exponent and tiny floats are spelled like json.dumps(indent=4)."""
+        raw = '{"big": 1e100, "small": 1.5e-7, "tiny": 0.00001, "x": [1e16, 0.0001], "s": "1e5"}'
+        expected = json.dumps(json.loads(raw), indent=4, ensure_ascii=False)
+        self.assertEqual(format_json(raw), expected)
+        # Scalar documents too
+        self.assertEqual(format_json('1e100'), '1e+100')
+        self.assertEqual(format_json('0.00001'), '1e-05')
+        self.assertEqual(format_json('-1.5e-7'), '-1.5e-07')
+    
+    def test_json_line_round_trip(self):
+        """Test JSONL lines are single-line UTF-8 JSON (orjson or not)."""
+        entry = {"method": "GET", "url": "https://example.com/\u00e9", "status": 200, "elapsed": 0.25}
+        line = json_dumps_line(entry)
+        
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertNotIn(b"\n", line[:-1])
+        self.assertEqual(json.loads(line.decode("utf-8")), entry)
+        self.assertEqual(json_loads(line.decode("utf-8")), entry)
+        self.assertEqual(json.loads(json_dumps_line({"id": 2 ** 70})), {"id": 2 ** 70})
+
 
 class TestHeaderParsing(unittest.TestCase):
     """Tests for header parsing."""
@@ -114,6 +206,13 @@ class TestHeaderParsing(unittest.TestCase):
         self.assertEqual(result["Content-Type"], "application/json")
         self.assertEqual(result["Authorization"], "Bearer token123")
     
+    def test_parse_headers_crlf_and_colons(self):
+        """Test CRLF line endings and colons inside values."""
+        headers_text = "Accept: */*\r\nX-Url: http://example.com:8080\r\nnot a header\r\n"
+        result = parse_headers(headers_text)
+        
+        self.assertEqual(result, {"Accept": "*/*", "X-Url": "http://example.com:8080"})
+    
     def test_parse_empty_headers(self):
         """Test empty headers return empty dict."""
         self.assertEqual(parse_headers(""), {})
@@ -121,5 +220,64 @@ class TestHeaderParsing(unittest.TestCase):
         self.assertEqual(parse_headers("   "), {})
 
 
+
+class TestRequestErrors(unittest.TestCase):
+    """Tests for request errors that need no network access."""
+    
+    def test_invalid_url_rejected(self):
+        """Security: Unsafe URLs are rejected before any request is made."""
+        result = send_api_request("GET", "file:///etc/passwd")
+        self.assertFalse(result.success)
+        self.assertIn("Invalid or unsafe URL", result.error)
+    
+    def test_invalid_json_body_rejected(self):
+        """Test malformed request bodies are reported, not sent."""
+        result = send_api_request("POST", "http://localhost:1/api", payload="{broken")
+        self.assertFalse(result.success)
+        self.assertIn("Invalid JSON in request body", result.error)
+    
+    def test_connection_error_message(self):
+        """Test requests go through the shared session and map its errors."""
+        refused = requests.exceptions.ConnectionError("refused")
+        with mock.patch.object(logic._SESSION, "request", side_effect=refused) as request:
+            result = send_api_request("POST", "http://localhost:1/api", payload='{"a": 1}')
+        
+        self.assertEqual(request.call_args.kwargs["method"], "POST")
+        self.assertEqual(request.call_args.kwargs["json"], {"a": 1})
+        self.assertTrue(result.error.startswith("Connection failed"))
+    
+    def test_get_without_body_uses_fast_path(self):
+        """Test a GET without body skips the session (fast urllib3 path)."""
+        refused = urllib3.exceptions.MaxRetryError(
+            None, "/", urllib3.exceptions.NewConnectionError(None, "refused")
+        )
+        with mock.patch.object(logic, "_USE_FAST_GET", True), \
+                mock.patch.object(logic, "_fast_get", side_effect=refused) as fast_get, \
+                mock.patch.object(logic._SESSION, "request") as request:
+            result = send_api_request("GET", "http://localhost:1/api", payload="")
+        
+        fast_get.assert_called_once()
+        request.assert_not_called()
+        self.assertTrue(result.error.startswith("Connection failed"))
+    
+    def test_fast_get_error_messages(self):
+        """Test urllib3 errors map to the same messages as the requests path."""
+        refused = urllib3.exceptions.MaxRetryError(
+            None, "/", urllib3.exceptions.NewConnectionError(None, "refused")
+        )
+        timed_out = urllib3.exceptions.MaxRetryError(
+            None, "/", urllib3.exceptions.ReadTimeoutError(None, "/", "read timed out")
+        )
+        self.assertTrue(logic._fast_get_error(refused, 10).error.startswith("Connection failed"))
+        self.assertEqual(logic._fast_get_error(timed_out, 10).error, "Request timed out after 10 seconds")
+    
+    def test_fast_path_text_decoding(self):
+        """Test fast-path bodies decode like Response.text."""
+        self.assertEqual(logic._decode_body("é".encode("latin-1"), "ISO-8859-1"), "é")
+        self.assertEqual(logic._decode_body("ok".encode(), "no-such-charset"), "ok")
+        self.assertEqual(logic._decode_body(b"", None), "")
+        self.assertEqual(logic._decode_body("héllo wörld".encode(), None), "héllo wörld")
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,53 @@
+"""
+NanoMan Unit Tests
+Tests for auth presets and API template lookups.
+Run with: python -m pytest tests/ -v
+"""
+
+import unittest
+from src.presets import (
+    AUTH_PRESETS, API_TEMPLATES,
+    get_auth_preset_names, get_api_template_names,
+    get_auth_preset_by_name, get_api_template_by_name,
+)
+
+
+class TestPresetLookup(unittest.TestCase):
+    """Tests for preset/template lookup by display name."""
+    
+    def test_auth_preset_by_name(self):
+        """Test every auth preset is found by its display name."""
+        for key, preset in AUTH_PRESETS.items():
+            with self.subTest(preset=key):
+                self.assertIs(get_auth_preset_by_name(preset["name"]), preset)
+    
+    def test_api_template_by_name(self):
+        """Test every API template is found by its display name."""
+        for key, template in API_TEMPLATES.items():
+            with self.subTest(template=key):
+                self.assertIs(get_api_template_by_name(template["name"]), template)
+    
+    def test_unknown_names_fall_back(self):
+        """Test unknown names return the default preset/template."""
+        self.assertIs(get_auth_preset_by_name("Nope"), AUTH_PRESETS["none"])
+        self.assertIs(get_api_template_by_name("Nope"), API_TEMPLATES["localhost"])
+    
+    def test_presets_are_read_only(self):
+        """Test preset and template mappings cannot be mutated."""
+        with self.assertRaises(TypeError):
+            AUTH_PRESETS["custom"] = {}
+        with self.assertRaises(TypeError):
+            API_TEMPLATES["github"]["base_url"] = "http://evil"
+    
+    def test_names_in_definition_order(self):
+        """Test name lists follow dict order and are safe to mutate."""
+        self.assertEqual(get_auth_preset_names(), [p["name"] for p in AUTH_PRESETS.values()])
+        self.assertEqual(get_api_template_names(), [t["name"] for t in API_TEMPLATES.values()])
+        
+        names = get_auth_preset_names()
+        names.clear()
+        self.assertTrue(get_auth_preset_names())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+"""
+NanoMan Unit Tests
+Tests for history file loading and request helpers (no window is created).
+Run with: python -m pytest tests/ -v
+"""
+
+import json
+import tempfile
+import unittest
+from collections import deque
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from src import ui
+
+
+class TestHistoryLoad(unittest.TestCase):
+    """Tests for load_history on a crash-damaged history.jsonl."""
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.history_file = Path(self.dir.name) / "history.jsonl"
+        patcher = mock.patch.multiple(
+            ui,
+            HISTORY_FILE=self.history_file,
+            LEGACY_HISTORY_FILE=Path(self.dir.name) / "history.json",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self) -> SimpleNamespace:
+        """Run NanoManApp.load_history on a stand-in app object."""
+        app = SimpleNamespace(history=deque(maxlen=ui.MAX_HISTORY_ITEMS))
+        app.save_history = lambda: ui.NanoManApp.save_history(app)
+        ui.NanoManApp.load_history(app)
+        return app
+
+    def test_torn_last_line_is_dropped(self):
+        """Test a cut-off last line is skipped and removed from the file."""
+        self.history_file.write_bytes(b'{"method": "GET", "url": "http://a"}\n{"method": "PO')
+        app = self.load()
+
+        self.assertEqual([item["url"] for item in app.history], ["http://a"])
+        content = self.history_file.read_bytes()
+        self.assertEqual([json.loads(line) for line in content.splitlines()], [{"method": "GET", "url": "http://a"}])
+        self.assertTrue(content.endswith(b"\n"))
+
+    def test_torn_multibyte_character(self):
+        """Test a line cut inside a UTF-8 character does not stop loading."""
+        self.history_file.write_bytes(b'{"url": "http://a"}\n{"url": "http://b/\xc3')
+        app = self.load()
+
+        self.assertEqual([item["url"] for item in app.history], ["http://a"])
+        self.assertTrue(self.history_file.read_bytes().endswith(b"\n"))
+
+
+
+class TestRequestPayload(unittest.TestCase):
+    """Tests for the body sent with a request."""
+
+    def test_default_body_dropped_on_get(self):
+        """Test the untouched placeholder body is not sent with a GET."""
+        self.assertEqual(ui.request_payload("GET", ui.DEFAULT_BODY), "")
+
+    def test_edited_or_non_get_body_kept(self):
+        """Test edited GET bodies and bodies of other methods are sent."""
+        self.assertEqual(ui.request_payload("GET", '{"query": 1}'), '{"query": 1}')
+        self.assertEqual(ui.request_payload("POST", ui.DEFAULT_BODY), ui.DEFAULT_BODY)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)